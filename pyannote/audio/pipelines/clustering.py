@@ -121,12 +121,11 @@ class BaseClustering(Pipeline):
         num_chunks, num_speakers, num_clusters = soft_clusters.shape
         # num_chunks, num_speakers, num_clusters
 
-        hard_clusters = -2 * np.ones((num_chunks, num_speakers), dtype=np.int8)
+        hard_clusters = np.full((num_chunks, num_speakers), -2, dtype=np.int8)
 
         for c, cost in enumerate(soft_clusters):
             speakers, clusters = linear_sum_assignment(cost, maximize=True)
-            for s, k in zip(speakers, clusters):
-                hard_clusters[c, s] = k
+            hard_clusters[c, speakers] = clusters
 
         return hard_clusters
 
@@ -188,7 +187,9 @@ class BaseClustering(Pipeline):
             c=num_chunks,
             s=num_speakers,
         )
-        soft_clusters = 2 - e2k_distance
+        # turn distances into similarities in place, instead of allocating
+        # yet another (num_chunks, num_speakers, num_clusters) array
+        soft_clusters = np.subtract(2.0, e2k_distance, out=e2k_distance)
 
         # assign each embedding to the cluster with the most similar centroid
         if constrained:
@@ -209,6 +210,7 @@ class BaseClustering(Pipeline):
         num_clusters: Optional[int] = None,
         min_clusters: Optional[int] = None,
         max_clusters: Optional[int] = None,
+        file: Optional[AudioFile] = None,
         **kwargs,
     ) -> np.ndarray:
         """Apply clustering
@@ -227,6 +229,8 @@ class BaseClustering(Pipeline):
             Minimum number of clusters. Has no effect when `num_clusters` is provided.
         max_clusters : int, optional
             Maximum number of clusters. Has no effect when `num_clusters` is provided.
+        file : AudioFile, optional
+            Processed file. Only used for caching intermediate results during training.
 
         Returns
         -------
@@ -267,6 +271,7 @@ class BaseClustering(Pipeline):
             min_clusters,
             max_clusters,
             num_clusters=num_clusters,
+            file=file,
         )
 
         hard_clusters, soft_clusters, centroids = self.assign_embeddings(
@@ -324,6 +329,7 @@ class AgglomerativeClustering(BaseClustering):
         min_clusters: int,
         max_clusters: int,
         num_clusters: Optional[int] = None,
+        file: Optional[AudioFile] = None,
     ):
         """
 
@@ -338,6 +344,9 @@ class AgglomerativeClustering(BaseClustering):
         num_clusters : int, optional
             Actual number of clusters. Default behavior is to estimate it based
             on values provided for `min_clusters`,  `max_clusters`, and `threshold`.
+        file : AudioFile, optional
+            Processed file. When training, the dendrogram is cached in it so that
+            it can be reused by subsequent trials.
 
         Returns
         -------
@@ -362,16 +371,40 @@ class AgglomerativeClustering(BaseClustering):
         if self.metric == "cosine" and self.method in ["centroid", "median", "ward"]:
             with np.errstate(divide="ignore", invalid="ignore"):
                 embeddings /= np.linalg.norm(embeddings, axis=-1, keepdims=True)
-            dendrogram: np.ndarray = linkage(
-                embeddings, method=self.method, metric="euclidean"
-            )
+            metric = "euclidean"
 
         # other methods work just fine with any metric
+        else:
+            metric = self.metric
+
+        # when optimizing the hyper-parameters of the pipeline, the very same embeddings
+        # are clustered again and again with different values of `threshold` and
+        # `min_cluster_size`. since the dendrogram only depends on embeddings and
+        # linkage method, it is computed once and re-used by subsequent trials.
+        cache = dict()
+        if self.training and file is not None:
+            cache = file.get("training_cache/dendrogram", dict())
+
+        if (
+            cache.get("method") == self.method
+            and cache.get("metric") == metric
+            and np.array_equal(cache["embeddings"], embeddings)
+        ):
+            dendrogram: np.ndarray = cache["dendrogram"]
+
         else:
             dendrogram: np.ndarray = linkage(
-                embeddings, method=self.method, metric=self.metric
+                embeddings, method=self.method, metric=metric
             )
 
+            if self.training and file is not None:
+                file["training_cache/dendrogram"] = {
+                    "method": self.method,
+                    "metric": metric,
+                    "embeddings": embeddings,
+                    "dendrogram": dendrogram,
+                }
+
         # apply the predefined threshold
         clusters = fcluster(dendrogram, self.threshold, criterion="distance") - 1
 
@@ -463,12 +496,14 @@ class AgglomerativeClustering(BaseClustering):
             ]
         )
         centroids_cdist = cdist(large_centroids, small_centroids, metric=self.metric)
-        for small_k, large_k in enumerate(np.argmin(centroids_cdist, axis=0)):
-            clusters[clusters == small_clusters[small_k]] = large_clusters[large_k]
 
-        # re-number clusters from 0 to num_large_clusters
-        _, clusters = np.unique(clusters, return_inverse=True)
-        return clusters
+        # build a lookup table that maps every original cluster to its (re-numbered
+        # from 0 to num_large_clusters) large cluster, and apply it in one single pass
+        # rather than scanning all embeddings once per small cluster
+        mapping = np.empty((np.max(cluster_unique) + 1,), dtype=int)
+        mapping[large_clusters] = np.arange(num_large_clusters)
+        mapping[small_clusters] = np.argmin(centroids_cdist, axis=0)
+        return mapping[clusters]
 
 
 class OracleClustering(BaseClustering):
@@ -521,7 +556,7 @@ class OracleClustering(BaseClustering):
             :, : min(num_frames, oracle_num_frames)
         ]
 
-        hard_clusters = -2 * np.ones((num_chunks, num_speakers), dtype=np.int8)
+        hard_clusters = np.full((num_chunks, num_speakers), -2, dtype=np.int8)
         soft_clusters = np.zeros((num_chunks, num_speakers, num_clusters))
         for c, (segmentation, oracle) in enumerate(
             zip(segmentations, oracle_segmentations)
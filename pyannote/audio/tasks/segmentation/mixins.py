@@ -379,21 +379,24 @@ class SegmentationTask(Task):
             logger=True,
         )
 
-        # log first batch visualization every 2^n epochs.
+        # log first batch visualization every 2^n epochs
+        # (only on main process as loggers are no-op on the other ones).
         if (
             self.model.current_epoch == 0
             or math.log2(self.model.current_epoch) % 1 > 0
             or batch_idx > 0
+            or not self.model.trainer.is_global_zero
         ):
             return
 
         # visualize first 9 validation samples of first batch in Tensorboard/MLflow
-        X = X.cpu().numpy()
-        y = y.float().cpu().numpy()
-        y_pred = y_pred.cpu().numpy()
+        num_samples = min(self.batch_size, 9)
+
+        # only move (and reshape below) the samples that are actually plotted
+        y = y[:num_samples].float().cpu().numpy()
+        y_pred = y_pred[:num_samples].cpu().numpy()
 
         # prepare 3 x 3 grid (or smaller if batch size is smaller)
-        num_samples = min(self.batch_size, 9)
         nrows = math.ceil(math.sqrt(num_samples))
         ncols = math.ceil(num_samples / nrows)
         fig, axes = plt.subplots(
@@ -200,6 +200,21 @@ class SpeakerDiarization(SegmentationTask):
     def setup(self, stage=None):
         super().setup(stage)
 
+        # annotated segments are stored file after file by `prepare_data` so that
+        # annotations of `file_id` file are found in the contiguous range
+        # [offsets[file_id], offsets[file_id + 1]) without scanning all of them
+        file_ids = self.prepared_data["annotations-segments"]["file_id"]
+        if np.any(np.diff(file_ids) < 0):
+            # `prepared_data` may have been loaded from a cache that was not
+            # sorted by file: sort it once (keeping order within each file)
+            self.prepared_data["annotations-segments"] = self.prepared_data[
+                "annotations-segments"
+            ][np.argsort(file_ids, kind="stable")]
+            file_ids = self.prepared_data["annotations-segments"]["file_id"]
+
+        num_files = len(self.prepared_data["audio-metadata"])
+        self._annotations_offsets = np.searchsorted(file_ids, np.arange(num_files + 1))
+
         # estimate maximum number of speakers per chunk when not provided
         if self.max_speakers_per_chunk is None:
             training = self.prepared_data["audio-metadata"]["subset"] == Subsets.index(
@@ -212,9 +227,9 @@ class SpeakerDiarization(SegmentationTask):
                 np.where(training)[0], description=progress_description
             ):
                 annotations = self.prepared_data["annotations-segments"][
-                    np.where(
-                        self.prepared_data["annotations-segments"]["file_id"] == file_id
-                    )[0]
+                    self._annotations_offsets[file_id] : self._annotations_offsets[
+                        file_id + 1
+                    ]
                 ]
                 annotated_regions = self.prepared_data["annotations-regions"][
                     np.where(
@@ -346,7 +361,7 @@ class SpeakerDiarization(SegmentationTask):
 
         # gather all annotations of current file
         annotations = self.prepared_data["annotations-segments"][
-            self.prepared_data["annotations-segments"]["file_id"] == file_id
+            self._annotations_offsets[file_id] : self._annotations_offsets[file_id + 1]
         ]
 
         # gather all annotations with non-empty intersection with current chunk
@@ -355,8 +370,9 @@ class SpeakerDiarization(SegmentationTask):
         ]
 
         # discretize chunk annotations at model output resolution
-        step = self.model.receptive_field.step
-        half = 0.5 * self.model.receptive_field.duration
+        receptive_field = self.model.receptive_field
+        step = receptive_field.step
+        half = 0.5 * receptive_field.duration
 
         start = np.maximum(chunk_annotations["start"], chunk.start) - chunk.start - half
         start_idx = np.maximum(0, np.round(start / step)).astype(int)
@@ -365,7 +381,11 @@ class SpeakerDiarization(SegmentationTask):
         end_idx = np.round(end / step).astype(int)
 
         # get list and number of labels for current scope
-        labels = list(np.unique(chunk_annotations[label_scope_key]))
+        # (as well as the index of the label of each annotation)
+        labels, label_idx = np.unique(
+            chunk_annotations[label_scope_key], return_inverse=True
+        )
+        labels = list(labels)
         num_labels = len(labels)
 
         if num_labels > self.max_speakers_per_chunk:
@@ -377,16 +397,15 @@ class SpeakerDiarization(SegmentationTask):
         )
         y = np.zeros((num_frames, num_labels), dtype=np.uint8)
 
-        # map labels to indices
-        mapping = {label: idx for idx, label in enumerate(labels)}
-
-        for start, end, label in zip(
-            start_idx, end_idx, chunk_annotations[label_scope_key]
-        ):
-            mapped_label = mapping[label]
+        for start, end, mapped_label in zip(start_idx, end_idx, label_idx):
+            # annotations ending right after the chunk start may be discretized
+            # before its first frame (end < start). skip them, as a negative
+            # `end` would otherwise wrap around and mark most of the chunk.
+            if end < start:
+                continue
             y[start : end + 1, mapped_label] = 1
 
-        sample["y"] = SlidingWindowFeature(y, self.model.receptive_field, labels=labels)
+        sample["y"] = SlidingWindowFeature(y, receptive_field, labels=labels)
 
         metadata = self.prepared_data["audio-metadata"][file_id]
         sample["meta"] = {key: metadata[key] for key in metadata.dtype.names}
@@ -412,33 +431,33 @@ class SpeakerDiarization(SegmentationTask):
             zeros (artificial inactive speakers).
         """
 
-        collated_y = []
-        for b in batch:
+        # write each sample directly into the final batch array
+        # (rather than stacking a list of per-sample arrays afterwards)
+        num_frames, _ = batch[0]["y"].data.shape
+        collated_y = np.zeros(
+            (len(batch), num_frames, self.max_speakers_per_chunk),
+            dtype=batch[0]["y"].data.dtype,
+        )
+
+        for i, b in enumerate(batch):
             y = b["y"].data
             num_speakers = len(b["y"].labels)
             if num_speakers > self.max_speakers_per_chunk:
-                # sort speakers in descending talkativeness order
-                indices = np.argsort(-np.sum(y, axis=0), axis=0)
+                # find the most talkative speakers (no need to fully sort them
+                # as the loss is permutation-invariant anyway)
+                indices = np.argpartition(
+                    np.sum(y, axis=0), -self.max_speakers_per_chunk
+                )[-self.max_speakers_per_chunk :]
                 # keep only the most talkative speakers
-                y = y[:, indices[: self.max_speakers_per_chunk]]
-
-                # TODO: we should also sort the speaker labels in the same way
+                y = y[:, indices]
 
-            elif num_speakers < self.max_speakers_per_chunk:
-                # create inactive speakers by zero padding
-                y = np.pad(
-                    y,
-                    ((0, 0), (0, self.max_speakers_per_chunk - num_speakers)),
-                    mode="constant",
-                )
-
-            else:
-                # we have exactly the right number of speakers
-                pass
+                # TODO: we should also select the speaker labels in the same way
 
-            collated_y.append(y)
+            # when there are less than `max_speakers_per_chunk` speakers, remaining
+            # (zero-initialized) columns of `collated_y` act as inactive speakers
+            collated_y[i, :, : y.shape[1]] = y
 
-        return torch.from_numpy(np.stack(collated_y))
+        return torch.from_numpy(collated_y)
 
     def segmentation_loss(
         self,
@@ -453,7 +472,8 @@ class SpeakerDiarization(SegmentationTask):
         permutated_prediction : (batch_size, num_frames, num_classes) torch.Tensor
             Permutated speaker activity predictions.
         target : (batch_size, num_frames, num_speakers) torch.Tensor
-            Speaker activity.
+            Speaker activity. In powerset mode, (batch_size, num_frames) powerset
+            class indices are also accepted, saving the conversion from one-hot.
         weight : (batch_size, num_frames, 1) torch.Tensor, optional
             Frames weight.
 
@@ -470,9 +490,11 @@ class SpeakerDiarization(SegmentationTask):
                 if self.weigh_by_cardinality
                 else None
             )
+            if target.dim() == 3:
+                target = torch.argmax(target, dim=-1)
             seg_loss = nll_loss(
                 permutated_prediction,
-                torch.argmax(target, dim=-1),
+                target,
                 class_weight=class_weight,
                 weight=weight,
             )
@@ -546,13 +568,19 @@ class SpeakerDiarization(SegmentationTask):
         # drop samples that contain too many speakers
         num_speakers: torch.Tensor = torch.sum(torch.any(target, dim=1), dim=1)
         keep: torch.Tensor = num_speakers <= self.max_speakers_per_chunk
-        target = target[keep]
-        waveform = waveform[keep]
+
+        # a single device-to-host sync for both checks below
+        num_kept = int(keep.sum())
 
         # corner case
-        if not keep.any():
+        if num_kept == 0:
             return None
 
+        # only copy the batch when some samples are actually dropped
+        if num_kept < len(keep):
+            target = target[keep]
+            waveform = waveform[keep]
+
         # forward pass
         prediction = self.model(waveform)
         batch_size, num_frames, _ = prediction.shape
@@ -575,11 +603,11 @@ class SpeakerDiarization(SegmentationTask):
         if self.specifications.powerset:
             multilabel = self.model.powerset.to_multilabel(prediction)
             permutated_target, _ = permutate(multilabel, target)
-            permutated_target_powerset = self.model.powerset.to_powerset(
+            permutated_target_indices = self.model.powerset.to_powerset_indices(
                 permutated_target.float()
             )
             seg_loss = self.segmentation_loss(
-                prediction, permutated_target_powerset, weight=weight
+                prediction, permutated_target_indices, weight=weight
             )
 
         else:
@@ -604,6 +632,10 @@ class SpeakerDiarization(SegmentationTask):
             # TODO: vad_loss probably does not make sense in powerset mode
             # because first class (empty set of labels) does exactly this...
             if self.specifications.powerset:
+                permutated_target_powerset = torch.nn.functional.one_hot(
+                    permutated_target_indices,
+                    num_classes=self.model.powerset.num_powerset_classes,
+                )
                 vad_loss = self.voice_activity_detection_loss(
                     prediction, permutated_target_powerset, weight=weight
                 )
@@ -707,11 +739,11 @@ class SpeakerDiarization(SegmentationTask):
 
             # FIXME: handle case where target have too many speakers?
             # since we don't need
-            permutated_target_powerset = self.model.powerset.to_powerset(
+            permutated_target_indices = self.model.powerset.to_powerset_indices(
                 permutated_target.float()
             )
             seg_loss = self.segmentation_loss(
-                prediction, permutated_target_powerset, weight=weight
+                prediction, permutated_target_indices, weight=weight
             )
 
         else:
@@ -736,6 +768,10 @@ class SpeakerDiarization(SegmentationTask):
             # TODO: vad_loss probably does not make sense in powerset mode
             # because first class (empty set of labels) does exactly this...
             if self.specifications.powerset:
+                permutated_target_powerset = torch.nn.functional.one_hot(
+                    permutated_target_indices,
+                    num_classes=self.model.powerset.num_powerset_classes,
+                )
                 vad_loss = self.voice_activity_detection_loss(
                     prediction, permutated_target_powerset, weight=weight
                 )
@@ -792,25 +828,28 @@ class SpeakerDiarization(SegmentationTask):
             logger=True,
         )
 
-        # log first batch visualization every 2^n epochs.
+        # log first batch visualization every 2^n epochs
+        # (only on main process as loggers are no-op on the other ones).
         if (
             self.model.current_epoch == 0
             or math.log2(self.model.current_epoch) % 1 > 0
             or batch_idx > 0
+            or not self.model.trainer.is_global_zero
         ):
             return
 
         # visualize first 9 validation samples of first batch in Tensorboard/MLflow
+        num_samples = min(self.batch_size, 9)
 
+        # only move (and reshape below) the samples that are actually plotted
         if self.specifications.powerset:
-            y = permutated_target.float().cpu().numpy()
-            y_pred = multilabel.cpu().numpy()
+            y = permutated_target[:num_samples].float().cpu().numpy()
+            y_pred = multilabel[:num_samples].cpu().numpy()
         else:
-            y = target.float().cpu().numpy()
-            y_pred = permutated_prediction.cpu().numpy()
+            y = target[:num_samples].float().cpu().numpy()
+            y_pred = permutated_prediction[:num_samples].cpu().numpy()
 
         # prepare 3 x 3 grid (or smaller if batch size is smaller)
-        num_samples = min(self.batch_size, 9)
         nrows = math.ceil(math.sqrt(num_samples))
         ncols = math.ceil(num_samples / nrows)
         fig, axes = plt.subplots(
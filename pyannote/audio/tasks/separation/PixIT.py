@@ -770,12 +770,15 @@ class PixIT(SegmentationTask):
             y = b["y"].data
             num_speakers = len(b["y"].labels)
             if num_speakers > self.max_speakers_per_chunk:
-                # sort speakers in descending talkativeness order
-                indices = np.argsort(-np.sum(y, axis=0), axis=0)
+                # find the most talkative speakers (no need to fully sort them
+                # as the loss is permutation-invariant anyway)
+                indices = np.argpartition(
+                    np.sum(y, axis=0), -self.max_speakers_per_chunk
+                )[-self.max_speakers_per_chunk :]
                 # keep only the most talkative speakers
-                y = y[:, indices[: self.max_speakers_per_chunk]]
+                y = y[:, indices]
 
-                # TODO: we should also sort the speaker labels in the same way
+                # TODO: we should also select the speaker labels in the same way
 
             elif num_speakers < self.max_speakers_per_chunk:
                 # create inactive speakers by zero padding
@@ -131,6 +131,21 @@ class Powerset(nn.Module):
         """Alias for `to_multilabel`"""
         return self.to_multilabel(powerset, soft=soft)
 
+    def to_powerset_indices(self, multilabel: torch.Tensor) -> torch.Tensor:
+        """Convert (hard) predictions from multi-label to powerset class indices
+
+        Parameter
+        ---------
+        multi_label : (batch_size, num_frames, num_classes) torch.Tensor
+            Prediction in "multi-label" space.
+
+        Returns
+        -------
+        indices : (batch_size, num_frames) torch.Tensor
+            Powerset class indices (i.e. `to_powerset` without one-hot encoding).
+        """
+        return torch.argmax(torch.matmul(multilabel, self.mapping.T), dim=-1)
+
     def to_powerset(self, multilabel: torch.Tensor) -> torch.Tensor:
         """Convert (hard) predictions from multi-label to powerset
 
@@ -151,7 +166,7 @@ class Powerset(nn.Module):
         case, the resulting powerset output will most likely not make much sense.
         """
         return F.one_hot(
-            torch.argmax(torch.matmul(multilabel, self.mapping.T), dim=-1),
+            self.to_powerset_indices(multilabel),
             num_classes=self.num_powerset_classes,
         )
 
@@ -0,0 +1,90 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyannote.core import SlidingWindow, SlidingWindowFeature
+from pyannote.database import FileFinder, get_protocol
+
+from pyannote.audio.models.segmentation import PyanNet
+from pyannote.audio.tasks import SpeakerDiarization
+
+
+@pytest.fixture()
+def task():
+    protocol = get_protocol(
+        "Debug.SpeakerDiarization.Debug", preprocessors={"audio": FileFinder()}
+    )
+    task = SpeakerDiarization(protocol, duration=2.0, batch_size=32, num_workers=0)
+    model = PyanNet(task=task)
+    model.prepare_data()
+    model.setup()
+    return task
+
+
+def test_prepare_chunk_skips_annotation_ending_before_first_frame(task):
+    # keep a single annotation
+    annotations = task.prepared_data["annotations-segments"][:1].copy()
+    file_id = annotations["file_id"][0]
+
+    receptive_field = task.model.receptive_field
+    step = receptive_field.step
+    half = 0.5 * receptive_field.duration
+
+    # choose chunk start so that the annotation ends right after it,
+    # but is discretized at least two frames before the first frame
+    annotations["start"] = 0.0
+    annotations["end"] = 1.0
+    start_time = annotations["end"][0] - 1e-3
+    assert np.round((annotations["end"][0] - start_time - half) / step) <= -2
+
+    task.prepared_data["annotations-segments"] = annotations
+    task._annotations_offsets = np.zeros(
+        len(task.prepared_data["audio-metadata"]) + 1, dtype=int
+    )
+    task._annotations_offsets[file_id + 1 :] = 1
+
+    sample = task.prepare_chunk(file_id, start_time, task.duration)
+    assert sample["y"].data.shape[1] == 1
+    assert not np.any(sample["y"].data)
+
+
+def test_setup_sorts_annotations_by_file(task, tmp_path):
+    with open(task.cache, "rb") as cache_file:
+        prepared_data = dict(np.load(cache_file, allow_pickle=True))
+    annotations = prepared_data["annotations-segments"]
+    prepared_data["annotations-segments"] = annotations[::-1]
+
+    task.cache = str(tmp_path / "shuffled.npz")
+    with open(task.cache, "wb") as cache_file:
+        np.savez_compressed(cache_file, **prepared_data)
+    task.setup()
+
+    offsets = task._annotations_offsets
+    segments = task.prepared_data["annotations-segments"]
+    assert len(segments) == len(annotations)
+    for file_id in range(len(task.prepared_data["audio-metadata"])):
+        file_segments = segments[offsets[file_id] : offsets[file_id + 1]]
+        assert np.all(file_segments["file_id"] == file_id)
+        assert np.array_equal(
+            np.sort(file_segments["start"]),
+            np.sort(annotations[annotations["file_id"] == file_id]["start"]),
+        )
+
+
+def test_collate_y_keeps_most_talkative_speakers():
+    # 4 speakers, 2 of which (0 and 2) are silent
+    y = np.zeros((10, 4), dtype=np.uint8)
+    y[:3, 1] = 1
+    y[:7, 3] = 1
+    sample = {
+        "y": SlidingWindowFeature(y, SlidingWindow(), labels=["a", "b", "c", "d"])
+    }
+
+    collated_y = SpeakerDiarization.collate_y(
+        SimpleNamespace(max_speakers_per_chunk=2), [sample, sample]
+    )
+
+    assert collated_y.shape == (2, 10, 2)
+    for chunk_y in collated_y.numpy():
+        kept = sorted(range(2), key=lambda k: np.sum(chunk_y[:, k]))
+        assert np.array_equal(chunk_y[:, kept], y[:, [1, 3]])
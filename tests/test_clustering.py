@@ -27,3 +27,110 @@ def test_agglomerative_clustering_num_cluster():
         embeddings=embeddings, min_clusters=2, max_clusters=2, num_clusters=2
     )
     assert np.array_equal(clusters, np.array([0, 1]))
+
+
+def _sample_embeddings(seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(3, 8))
+    return np.vstack([center + 0.1 * rng.normal(size=(10, 8)) for center in centers])
+
+
+def _counting_linkage(monkeypatch):
+    import pyannote.audio.pipelines.clustering as clustering
+
+    calls = []
+    original_linkage = clustering.linkage
+
+    def linkage(*args, **kwargs):
+        calls.append(1)
+        return original_linkage(*args, **kwargs)
+
+    monkeypatch.setattr(clustering, "linkage", linkage)
+    return calls
+
+
+def _instantiate(method: str = "average", threshold: float = 0.5, min_cluster_size=2):
+    return AgglomerativeClustering().instantiate(
+        {"method": method, "threshold": threshold, "min_cluster_size": min_cluster_size}
+    )
+
+
+def test_agglomerative_clustering_dendrogram_cache_reuse(monkeypatch):
+    calls = _counting_linkage(monkeypatch)
+    embeddings = _sample_embeddings()
+
+    clustering = _instantiate()
+    clustering.training = True
+    file = dict()
+
+    for _ in range(3):
+        clustering.cluster(np.copy(embeddings), 1, 30, file=file)
+
+    assert len(calls) == 1
+    assert "training_cache/dendrogram" in file
+
+
+def test_agglomerative_clustering_dendrogram_cache_invalidation(monkeypatch):
+    calls = _counting_linkage(monkeypatch)
+    embeddings = _sample_embeddings()
+
+    clustering = _instantiate()
+    clustering.training = True
+    file = dict()
+
+    clustering.cluster(np.copy(embeddings), 1, 30, file=file)
+    assert len(calls) == 1
+
+    # different embeddings
+    clustering.cluster(_sample_embeddings(seed=1), 1, 30, file=file)
+    assert len(calls) == 2
+
+    # different linkage method
+    clustering = _instantiate(method="complete")
+    clustering.training = True
+    clustering.cluster(_sample_embeddings(seed=1), 1, 30, file=file)
+    assert len(calls) == 3
+
+
+def test_agglomerative_clustering_dendrogram_cache_disabled(monkeypatch):
+    calls = _counting_linkage(monkeypatch)
+    embeddings = _sample_embeddings()
+
+    # not training: cache is neither read nor written
+    clustering = _instantiate()
+    clustering.training = False
+    file = {"training_cache/dendrogram": None}
+    for _ in range(2):
+        clustering.cluster(np.copy(embeddings), 1, 30, file=file)
+    assert len(calls) == 2
+    assert file["training_cache/dendrogram"] is None
+
+    # training but no file: nothing to cache into
+    clustering.training = True
+    for _ in range(2):
+        clustering.cluster(np.copy(embeddings), 1, 30, file=None)
+    assert len(calls) == 4
+
+
+def test_agglomerative_clustering_dendrogram_cache_same_clusters():
+    embeddings = _sample_embeddings()
+    file = dict()
+
+    for method in ["average", "centroid"]:
+        for threshold in [0.1, 0.5, 1.0, 1.5]:
+            for min_cluster_size in [1, 5, 12]:
+                expected = _instantiate(
+                    method=method,
+                    threshold=threshold,
+                    min_cluster_size=min_cluster_size,
+                ).cluster(np.copy(embeddings), 1, 30)
+
+                clustering = _instantiate(
+                    method=method,
+                    threshold=threshold,
+                    min_cluster_size=min_cluster_size,
+                )
+                clustering.training = True
+                clusters = clustering.cluster(np.copy(embeddings), 1, 30, file=file)
+
+                assert np.array_equal(clusters, expected)
@@ -51,6 +51,25 @@ def test_roundtrip():
             assert torch.equal(batch_powerset, reconstruction)
 
 
+def test_to_powerset_indices():
+    for num_classes in range(2, 5):
+        for max_set_size in range(1, num_classes + 1):
+            powerset = Powerset(num_classes, max_set_size)
+
+            # each frame is assigned to a different powerset class
+            indices = torch.arange(powerset.num_powerset_classes)[None]
+            multilabel = powerset.to_multilabel(
+                torch.nn.functional.one_hot(indices, powerset.num_powerset_classes)
+            )
+
+            reconstruction = powerset.to_powerset_indices(multilabel)
+
+            assert torch.equal(reconstruction, indices)
+            assert torch.equal(
+                torch.argmax(powerset.to_powerset(multilabel), dim=-1), indices
+            )
+
+
 def test_permutate_powerset():
     for num_classes in range(1, 6):
         for max_set_size in range(1, num_classes + 1):